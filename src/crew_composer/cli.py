@@ -3,9 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import sys
-import subprocess
 from typing import Any, Dict, Optional
-import asyncio
 
 import typer
 from dotenv import load_dotenv
@@ -17,34 +15,27 @@ from .config_loader import (
     load_tasks_config,
     load_crew_config,
     list_crew_names,
-    load_mcp_servers_config,
+    mcp_available,
+    mcp_stdio_required,
+    task_output_dirs,
     validate_all,
 )
-from .tool_registry import registry
 from .observability import init_observability
-from .crew import ConfigDrivenCrew
-from .scheduler import (
-    SchedulerService,
-    ScheduleEntry,
-    list_schedules as _list_schedules,
-    upsert_schedule as _upsert_schedule,
-    delete_schedule as _delete_schedule,
-)
+
+# Heavy modules (crewai via .crew/.scheduler, crewai_tools via .tool_registry, APScheduler)
+# are imported inside the commands that need them to keep `--help` and light commands fast.
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 console = Console()
 
 
 def _kv_to_dict(items: Optional[list[str]]) -> Dict[str, Any]:
-    data: Dict[str, Any] = {}
     if not items:
-        return data
-    for item in items:
-        if "=" not in item:
-            raise typer.BadParameter(f"Invalid input pair: '{item}'. Use key=value format.")
-        k, v = item.split("=", 1)
-        data[k] = v
-    return data
+        return {}
+    bad = next((item for item in items if "=" not in item), None)
+    if bad is not None:
+        raise typer.BadParameter(f"Invalid input pair: '{bad}'. Use key=value format.")
+    return dict(item.split("=", 1) for item in items)
 
 
 def _ensure_mcp_if_needed(root: Path, crew_name: Optional[str]) -> None:
@@ -53,23 +44,14 @@ def _ensure_mcp_if_needed(root: Path, crew_name: Optional[str]) -> None:
     This avoids downstream auto-install prompts that may use an invalid requirement string.
     """
     try:
-        crew_cfg = load_crew_config(root, crew_name)
-        servers = load_mcp_servers_config(root, crew_cfg.tools_files)
+        if not mcp_stdio_required(root, crew_name):
+            return
     except Exception:
         return
-    needs_mcp = False
-    for spec in servers:
-        transport = (getattr(spec, "transport", "") or "").lower()
-        if transport == "stdio" or (not transport and getattr(spec, "command", None)):
-            needs_mcp = True
-            break
-    if not needs_mcp:
-        return
-    try:
-        import mcp  # type: ignore  # noqa: F401
+    if mcp_available():
         return
-    except Exception:
-        pass
+    import subprocess
+
     if typer.confirm("MCP stdio servers detected. Install required 'mcp' package now?", default=True):
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "mcp"])  # nosec B603
@@ -91,6 +73,8 @@ def validate(
     root = get_project_root()
     validate_all(root, crew)
     _ensure_mcp_if_needed(root, crew)
+    from .tool_registry import registry
+
     crew_cfg = load_crew_config(root, crew)
     _ = registry(root, crew_cfg.tools_files)  # build tools
     console.print("[green]Tools loaded successfully.[/green]")
@@ -104,6 +88,8 @@ def list_tools(
     load_dotenv(override=False)
     root = get_project_root()
     _ensure_mcp_if_needed(root, crew)
+    from .tool_registry import registry
+
     crew_cfg = load_crew_config(root, crew)
     reg = registry(root, crew_cfg.tools_files)
     for name in reg.all_names:
@@ -153,6 +139,8 @@ def run(
         init_observability(getattr(crew_cfg, "observability", {}))
     except Exception as e:  # noqa: BLE001
         console.print(f"[yellow]Observability init warning: {e}[/yellow]")
+    from .tool_registry import registry
+
     _ = registry(root, crew_cfg.tools_files)  # ensure tools are instantiated early for clearer errors
 
     data: Dict[str, Any] = {}
@@ -164,20 +152,18 @@ def run(
     data.update(_kv_to_dict(inputs))
     # Ensure any task output_file directories exist
     try:
-        tasks_cfg = load_tasks_config(root)
-        for task_name, task_cfg in tasks_cfg.items():
-            output_file = task_cfg.get("output_file")
-            if output_file:
-                out_path = (root / output_file).resolve()
-                out_dir = out_path.parent
-                out_dir.mkdir(parents=True, exist_ok=True)
+        for out_dir in task_output_dirs(root):
+            out_dir.mkdir(parents=True, exist_ok=True)
     except Exception as e:  # noqa: BLE001
         console.print(f"[yellow]Warning: unable to pre-create output directories: {e}[/yellow]")
 
     try:
-        crew_cfg = load_crew_config(root, crew)
+        from .crew import ConfigDrivenCrew
+
         crew_instance = ConfigDrivenCrew(crew_name=crew)
         if getattr(crew_cfg, "run_async", False):
+            import asyncio
+
             async def _run():
                 result = await crew_instance.kickoff_async(inputs=data or {"topic": "Hello World"})
                 return result
@@ -215,6 +201,8 @@ def ui(
     if headless:
         cmd += ["--server.headless", "true"]
     console.print(f"[bold]Starting UI:[/bold] {' '.join(cmd)}")
+    import subprocess
+
     try:
         subprocess.check_call(cmd, cwd=str(root))
     except subprocess.CalledProcessError as e:
@@ -234,6 +222,8 @@ def schedule_service(
     """
     load_dotenv(override=False)
     root = get_project_root()
+    from .scheduler import SchedulerService
+
     service = SchedulerService(root=root, poll_seconds=poll)
     service.run_forever()
 
@@ -242,6 +232,8 @@ def schedule_service(
 def schedule_list():
     """List all schedules from the store (db/schedules.json)."""
     load_dotenv(override=False)
+    from .scheduler import list_schedules as _list_schedules
+
     entries = _list_schedules()
     console.print(json.dumps([e.model_dump() for e in entries], indent=2))
 
@@ -262,6 +254,8 @@ def schedule_upsert(
 ):
     """Create or update a schedule entry."""
     load_dotenv(override=False)
+    from .scheduler import ScheduleEntry, upsert_schedule as _upsert_schedule
+
     cron_map: Optional[Dict[str, str]] = None
     if cron_json:
         try:
@@ -304,6 +298,8 @@ def schedule_upsert(
 def schedule_delete(id: str = typer.Argument(..., help="Schedule ID to delete.")):
     """Delete a schedule entry by ID."""
     load_dotenv(override=False)
+    from .scheduler import delete_schedule as _delete_schedule
+
     ok = _delete_schedule(id)
     console.print(json.dumps({"deleted": ok, "id": id}, indent=2))
 
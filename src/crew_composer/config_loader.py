@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Union
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from rich.console import Console
 
 from .errors import ConfigNotFoundError, InvalidConfigError
@@ -49,6 +56,11 @@ class MCPServerSpec(BaseModel):
     exclude_tools: List[str] = Field(default_factory=list)
 
 
+# Validate whole lists in one pydantic-core call rather than per-item model_validate()
+_TOOL_LIST_ADAPTER: TypeAdapter[List[ToolSpec]] = TypeAdapter(List[ToolSpec])
+_MCP_LIST_ADAPTER: TypeAdapter[List[MCPServerSpec]] = TypeAdapter(List[MCPServerSpec])
+
+
 class CrewConfig(BaseModel):
     process: Optional[str] = Field(default="sequential")
     verbose: bool = Field(default=True)
@@ -86,43 +98,151 @@ class CrewConfig(BaseModel):
     ])
 
 
-def _resolve_env_placeholders(value: Any) -> Any:
-    """Resolve ${VAR} or ${VAR:default} placeholders in strings."""
+# Matches ${VAR} and ${VAR:default}; the default may be empty
+_ENV_RE = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
+
+
+def _env_sub(match: re.Match[str]) -> str:
+    var, default = match.group(1), match.group(2)
+    return os.getenv(var, default if default is not None else "")
+
+
+def _substitute_env(value: Any) -> Any:
     if isinstance(value, str):
-        out = ""
-        i = 0
-        while i < len(value):
-            if value[i : i + 2] == "${":
-                j = value.find("}", i + 2)
-                if j == -1:
-                    out += value[i:]
-                    break
-                token = value[i + 2 : j]
-                if ":" in token:
-                    var, default = token.split(":", 1)
-                    out += os.getenv(var, default)
-                else:
-                    out += os.getenv(token, "")
-                i = j + 1
-            else:
-                out += value[i]
-                i += 1
-        return out
+        if "${" not in value:
+            return value
+        return _ENV_RE.sub(_env_sub, value)
     if isinstance(value, Mapping):
-        return {k: _resolve_env_placeholders(v) for k, v in value.items()}
+        return {k: _substitute_env(v) for k, v in value.items()}
     if isinstance(value, list):
-        return [_resolve_env_placeholders(v) for v in value]
+        return [_substitute_env(v) for v in value]
     return value
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise ConfigNotFoundError(str(path))
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    if not isinstance(data, dict):
-        raise InvalidConfigError(f"YAML root must be a mapping: {path}")
-    return data
+def _resolve_env_placeholders(value: Any) -> Any:
+    """Resolve ${VAR} or ${VAR:default} placeholders in strings.
+
+    Containers without any placeholder are returned unchanged; the check is a single
+    C-level json.dumps scan rather than a Python-level walk of the tree.
+    """
+    if isinstance(value, (Mapping, list)):
+        try:
+            if "${" not in json.dumps(value, default=str):
+                return value
+        except (TypeError, ValueError):
+            pass
+    return _substitute_env(value)
+
+
+# Parsed YAML keyed by path; an entry is reused only while (st_mtime_ns, st_size, st_ino)
+# match. Least recently used entries are evicted beyond _YAML_CACHE_MAX.
+_YAML_CACHE: OrderedDict[str, tuple[int, int, int, Dict[str, Any]]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _sidecar_path(path: Path, digest: str) -> Optional[Path]:
+    """Return the sidecar location for a YAML file, or None if it gets no sidecar.
+
+    Only files directly in a project's config/ directory get one, under config/.cache/
+    (git-ignored); tools files elsewhere never leave cache directories behind.
+    """
+    if path.parent.name != "config":
+        return None
+    return path.parent / ".cache" / f"{path.name}.{digest}.json"
+
+
+def _read_sidecar(path: Path, digest: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON sidecar parse for this exact YAML content, if present."""
+    sidecar = _sidecar_path(path, digest)
+    if sidecar is None:
+        return None
+    try:
+        with sidecar.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_sidecar(path: Path, digest: str, data: Dict[str, Any]) -> None:
+    """Best-effort atomic write of a JSON sidecar keyed by the YAML content hash.
+
+    Skipped when the mapping does not survive a JSON round trip unchanged (e.g. dates or
+    non-string keys), so a sidecar never alters what callers see.
+    """
+    target = _sidecar_path(path, digest)
+    if target is None:
+        return
+    try:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        if json.loads(text) != data:
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        for stale in target.parent.glob(f"{path.name}.*.json"):
+            if stale != target:
+                stale.unlink(missing_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, target)
+    except (OSError, TypeError, ValueError):
+        # Sidecars are an optimization only; read-only or unusual configs just skip them
+        pass
+
+
+def _load_yaml(path: Path, copy_result: bool = True) -> Dict[str, Any]:
+    """Parse a YAML mapping, reusing the previous parse while the file is unchanged.
+
+    Across processes, for files in config/, a JSON sidecar under `config/.cache/` keyed
+    by a blake2b hash of the YAML bytes replaces the YAML parse when the content is
+    unchanged.
+
+    Callers receive a deep copy so mutating the result never affects the cache;
+    read-only callers may pass copy_result=False to share the cached mapping.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError as e:
+        raise ConfigNotFoundError(str(path)) from e
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:3] == (st.st_mtime_ns, st.st_size, st.st_ino):
+        _YAML_CACHE.move_to_end(key)
+        data = cached[3]
+    else:
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError as e:
+            raise ConfigNotFoundError(str(path)) from e
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        data = _read_sidecar(path, digest)
+        if data is None:
+            # JSON documents are valid YAML and parse much faster with json
+            if raw.lstrip().startswith(b"{"):
+                try:
+                    data = json.loads(raw) or {}
+                except ValueError:
+                    pass  # YAML flow mapping rather than JSON
+            if data is None:
+                data = yaml.load(raw, Loader=_YamlLoader) or {}
+            if not isinstance(data, dict):
+                raise InvalidConfigError(f"YAML root must be a mapping: {path}")
+            _write_sidecar(path, digest, data)
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, st.st_ino, data)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data) if copy_result else data
+
+
+def load_yaml_file(path: Path) -> Dict[str, Any]:
+    """Load a YAML mapping through the shared parse cache.
+
+    The result is shared with the cache and must be treated as read-only.
+    """
+    return _load_yaml(path, copy_result=False)
 
 
 def load_agents_config(root: Path) -> Dict[str, Any]:
@@ -135,6 +255,22 @@ def load_tasks_config(root: Path) -> Dict[str, Any]:
     return _resolve_env_placeholders(data)
 
 
+def task_output_dirs(root: Path) -> List[Path]:
+    """Return the unique parent directories of all task `output_file` paths.
+
+    Many tasks share a directory (e.g. output/), so callers can mkdir each one once.
+    Absolute paths are used as-is; relative ones are resolved against the project root.
+    """
+    dirs = set()
+    for t_cfg in load_tasks_config(root).values():
+        output_file = t_cfg.get("output_file") if isinstance(t_cfg, dict) else None
+        if not output_file:
+            continue
+        out_path = Path(output_file)
+        dirs.add(out_path.parent if out_path.is_absolute() else (root / out_path).resolve().parent)
+    return sorted(dirs)
+
+
 def load_crew_config(root: Path, crew_name: Optional[str] = None) -> CrewConfig:
     """Load a single crew config selected from config/crews.yaml.
 
@@ -143,7 +279,8 @@ def load_crew_config(root: Path, crew_name: Optional[str] = None) -> CrewConfig:
     - Otherwise, select the first crew key encountered.
     """
     path = root / "config" / "crews.yaml"
-    raw_all = _load_yaml(path)
+    # Read-only: only the selected crew is copied (below) before it reaches CrewConfig
+    raw_all = _load_yaml(path, copy_result=False)
     raw_all = _resolve_env_placeholders(raw_all)
     # Expect shape: {'crews': {name: { ... }, ... }}
     if not isinstance(raw_all, dict) or "crews" not in raw_all or not isinstance(raw_all["crews"], dict):
@@ -163,13 +300,15 @@ def load_crew_config(root: Path, crew_name: Optional[str] = None) -> CrewConfig:
     selected = crews_map[selected_name]
     if not isinstance(selected, dict):
         raise InvalidConfigError(f"Crew '{selected_name}' must be a mapping in {path}")
-    return CrewConfig.model_validate(selected)
+    # Without ${...} placeholders `selected` is the cached parse itself; copy it so nested
+    # values kept as-is (e.g. knowledge/observability dicts) don't alias the cache
+    return CrewConfig.model_validate(copy.deepcopy(selected))
 
 
 def list_crew_names(root: Path) -> List[str]:
     """Return the ordered list of crew names defined in config/crews.yaml."""
     path = root / "config" / "crews.yaml"
-    raw_all = _load_yaml(path)
+    raw_all = _load_yaml(path, copy_result=False)
     if not isinstance(raw_all, dict) or "crews" not in raw_all or not isinstance(raw_all["crews"], dict):
         raise InvalidConfigError(f"Expected 'crews' mapping at root of {path}")
     return list(raw_all["crews"].keys())
@@ -179,11 +318,12 @@ def load_tools_config(root: Path, tools_files: Optional[List[str]] = None) -> To
     tools_files = tools_files or ["config/tools.yaml"]
     merged: Dict[str, List[Dict[str, Any]]] = {}
     for rel in tools_files:
-        path = (root / rel).resolve()
-        if not path.exists():
+        path = root / rel
+        try:
+            raw = _load_yaml(path)
+        except ConfigNotFoundError:
             # Skip silently to allow optional files like mcp_tools.yaml
             continue
-        raw = _load_yaml(path)
         section = raw.get("tools", {})
         if not isinstance(section, dict):
             raise InvalidConfigError(f"'tools' must be a mapping in {path}")
@@ -196,16 +336,15 @@ def load_tools_config(root: Path, tools_files: Optional[List[str]] = None) -> To
     # Normalize to ToolSpec
     normalized: Dict[str, List[ToolSpec]] = {}
     for cat, items in merged.items():
-        specs = []
         for item in items:
             # Support both 'class' and 'class_name' in YAML
-            if "class_name" in item and "class" not in item:
+            if isinstance(item, dict) and "class_name" in item and "class" not in item:
                 item["class"] = item["class_name"]
-            spec = ToolSpec.model_validate(item)
+        specs = _TOOL_LIST_ADAPTER.validate_python(items)
+        for spec in specs:
             # Resolve env placeholders inside args and env
             spec.args = _resolve_env_placeholders(spec.args)
             spec.env = _resolve_env_placeholders(spec.env)
-            specs.append(spec)
         normalized[cat] = specs
     return ToolsConfig(tools=normalized)
 
@@ -218,10 +357,11 @@ def load_mcp_servers_config(root: Path, tools_files: Optional[List[str]] = None)
     tools_files = tools_files or ["config/mcp_tools.yaml"]
     servers: List[MCPServerSpec] = []
     for rel in tools_files:
-        path = (root / rel).resolve()
-        if not path.exists():
+        path = root / rel
+        try:
+            raw = _load_yaml(path)
+        except ConfigNotFoundError:
             continue
-        raw = _load_yaml(path)
         section = raw.get("servers", [])
         if section is None:
             continue
@@ -230,16 +370,68 @@ def load_mcp_servers_config(root: Path, tools_files: Optional[List[str]] = None)
         for item in section:
             if not isinstance(item, dict):
                 raise InvalidConfigError(f"Each server entry must be a mapping in {path}")
-            item = _resolve_env_placeholders(item)
-            spec = MCPServerSpec.model_validate(item)
-            # Resolve placeholders also in nested fields explicitly
-            spec.args = [_resolve_env_placeholders(x) for x in (spec.args or [])]
-            spec.env = _resolve_env_placeholders(spec.env)
-            spec.headers = _resolve_env_placeholders(spec.headers)
-            servers.append(spec)
+        # Resolving the raw mappings covers nested args/env/headers in one pass
+        servers.extend(_MCP_LIST_ADAPTER.validate_python(_resolve_env_placeholders(section)))
     return servers
 
 
+# Memoized stdio-MCP detection, keyed on config file mtimes so edits invalidate it
+_TOOLS_FILES_CACHE: Dict[tuple, tuple[str, ...]] = {}
+_STDIO_MCP_CACHE: Dict[tuple, bool] = {}
+_MCP_AVAILABLE: Optional[bool] = None
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def mcp_stdio_required(root: Path, crew_name: Optional[str] = None) -> bool:
+    """Return True if any MCP server configured for the crew uses stdio transport.
+
+    The result is cached per process and recomputed only when crews.yaml or one of
+    the crew's tools files changes on disk.
+    """
+    crews_key = (str(root), crew_name, _mtime_ns(root / "config" / "crews.yaml"))
+    tools_files = _TOOLS_FILES_CACHE.get(crews_key)
+    if tools_files is None:
+        tools_files = tuple(load_crew_config(root, crew_name).tools_files)
+        _TOOLS_FILES_CACHE[crews_key] = tools_files
+    key = (str(root), tuple((rel, _mtime_ns(root / rel)) for rel in tools_files))
+    required = _STDIO_MCP_CACHE.get(key)
+    if required is None:
+        required = False
+        for spec in load_mcp_servers_config(root, list(tools_files)):
+            transport = (spec.transport or "").lower()
+            if transport == "stdio" or (not transport and spec.command):
+                required = True
+                break
+        _STDIO_MCP_CACHE[key] = required
+    return required
+
+
+def mcp_available() -> bool:
+    """Return True if the optional 'mcp' package can be imported.
+
+    Only a positive result is cached. A negative one is re-probed on the next call,
+    after invalidating the import finder caches, so a `pip install mcp` made while a
+    long-running process (e.g. the UI) is up gets picked up without a restart.
+    """
+    global _MCP_AVAILABLE
+    if _MCP_AVAILABLE:
+        return True
+    if _MCP_AVAILABLE is False:
+        importlib.invalidate_caches()
+    try:
+        _MCP_AVAILABLE = importlib.util.find_spec("mcp") is not None
+    except (ImportError, ValueError):
+        _MCP_AVAILABLE = False
+    return _MCP_AVAILABLE
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Best-effort project root: 2 levels up from this file (src/pkg -> repo)."""
     return Path(__file__).resolve().parents[2]
@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import inspect
 import copy
+import heapq
+import keyword
+import os
+import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, ClassVar, Dict, List, Optional
 
 from crewai import Agent, Crew, Process, Task, CrewOutput
 from crewai.project import CrewBase, crew, task
 from rich.console import Console
+from rich.text import Text
 
 from .config_loader import get_project_root, load_agents_config, load_tasks_config, load_crew_config
 from .tool_registry import registry
@@ -17,6 +24,74 @@ from .observability import init_observability
 console = Console()
 
 
+def _print_notices(messages: List[str]) -> None:
+    """Print collected notices in one yellow styled Text, skipping rich's markup parser.
+
+    Also keeps names containing '[' from being read as markup.
+    """
+    if not messages:
+        return
+    console.print(Text("\n".join(messages), style="yellow"))
+
+
+def _crew_param_names() -> frozenset[str]:
+    """Return the field/parameter names accepted by Crew().
+
+    Prefers Pydantic model field introspection (Crew is a Pydantic model) and falls
+    back to the constructor signature for non-Pydantic implementations.
+    """
+    mf = getattr(Crew, "model_fields", None)
+    if isinstance(mf, dict):
+        return frozenset(mf.keys())
+    legacy = getattr(Crew, "__fields__", None)
+    if isinstance(legacy, dict):
+        return frozenset(legacy.keys())
+    return frozenset(inspect.signature(Crew.__init__).parameters.keys())
+
+
+# Agent settings passed as explicit Agent() kwargs when set in agents.yaml
+_OPTIONAL_AGENT_KEYS = (
+    "cache",
+    "human_input",
+    "allow_code_execution",
+    "multimodal",
+    "max_rpm",
+    "max_iter",
+    "llm_temperature",
+)
+
+# Keys that never belong in the Agent config payload
+_AGENT_CONFIG_EXCLUDE = frozenset(("tools", "tool_names", "enabled") + _OPTIONAL_AGENT_KEYS)
+
+# Crew() does not change within a process; introspect it once at import
+try:
+    _CREW_PARAMS: frozenset[str] = _crew_param_names()
+except Exception:  # noqa: BLE001
+    _CREW_PARAMS = frozenset()
+_CREW_ACCEPTS_PLANNING_LLM = "planning_llm" in _CREW_PARAMS
+_CREW_ACCEPTS_MANAGER_LLM = "manager_llm" in _CREW_PARAMS
+
+# Task() constructor parameters, likewise introspected once rather than per task build
+try:
+    _TASK_INIT_PARAMS: frozenset[str] = frozenset(inspect.signature(Task.__init__).parameters)
+except Exception:
+    _TASK_INIT_PARAMS = frozenset()
+_TASK_ACCEPTS_AGENT = "agent" in _TASK_INIT_PARAMS
+_TASK_ACCEPTS_CONTEXT = "context" in _TASK_INIT_PARAMS
+_TASK_ACCEPTS_HUMAN_INPUT = "human_input" in _TASK_INIT_PARAMS
+
+
+@dataclass(frozen=True, slots=True)
+class _AgentSpec:
+    """Per-agent build inputs extracted once from the agent YAML configs."""
+
+    config: Dict[str, Any]
+    tool_items: tuple
+    tool_names: tuple
+    verbose: bool
+    options: Dict[str, Any]
+
+
 @CrewBase
 class ConfigDrivenCrew:
     """Crew driven by YAML configs.
@@ -29,14 +104,18 @@ class ConfigDrivenCrew:
     # CrewAI will load these YAMLs into self.agents_config and self.tasks_config automatically
     # Use absolute paths so resolution is from project root, not package directory
     _BASE_DIR = Path(__file__).resolve().parents[2]
-    agents_config = str((_BASE_DIR / "config" / "agents.yaml").resolve())
-    tasks_config = str((_BASE_DIR / "config" / "tasks.yaml").resolve())
+    # _BASE_DIR is already resolved, so child paths need no further resolve()
+    agents_config = os.fspath(_BASE_DIR / "config" / "agents.yaml")
+    tasks_config = os.fspath(_BASE_DIR / "config" / "tasks.yaml")
+
+    # Task names that already have a synthesized @task wrapper on the class
+    _dynamic_tasks_attached: ClassVar[frozenset] = frozenset()
+    _dynamic_tasks_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, crew_name: Optional[str] = None) -> None:
         self.root: Path = get_project_root()
-        self._agents = load_agents_config(self.root)
-        self._tasks = load_tasks_config(self.root)
-        self._crew_cfg = load_crew_config(self.root, crew_name)
+        self._crew_name = crew_name
+        self._load_configs()
         # Initialize observability (best-effort) as early as possible so instrumentation wraps CrewAI
         try:
             init_observability(getattr(self._crew_cfg, "observability", {}))
@@ -45,70 +124,215 @@ class ConfigDrivenCrew:
             pass
         # Build registry with the tools for the selected crew
         self._tool_registry = registry(self.root, self._crew_cfg.tools_files)
+        # Agents commonly share tool sets; resolve each distinct name tuple once per instance
+        self._resolved_tools_cache: Dict[tuple, tuple] = {}
+        self._index_configs()
         # Ensure dynamic @task methods exist for YAML-defined tasks (for context resolution)
         self._ensure_dynamic_task_methods()
+        # Set on the first crew() call, once CrewBase has finished mapping its configs
+        self._configs_mapped = False
+        # Set once kickoff_async reloads the YAML: CrewBase's agents_config/tasks_config
+        # are only loaded at construction, so from then on the loader dicts are the source
+        self._configs_reloaded = False
+        # Built Crew reused across kickoff_async() calls until the YAML files change
+        self._crew_instance: Optional[Crew] = None
+        self._config_sig = self._config_signature()
+
+    def _load_configs(self) -> None:
+        """Load the agents, tasks and selected crew configs.
+
+        Agent/task names are interned: they are looked up repeatedly across the sets
+        and maps built from these configs, and interned keys compare by identity.
+        """
+        self._agents = {sys.intern(str(k)): v for k, v in load_agents_config(self.root).items()}
+        self._tasks = {sys.intern(str(k)): v for k, v in load_tasks_config(self.root).items()}
+        self._crew_cfg = load_crew_config(self.root, self._crew_name)
+
+    def _index_configs(self) -> None:
+        """Precompute enabled names, task references, default task order and Crew() kwargs."""
+        self._agent_enabled: Dict[str, bool] = {
+            name: bool(cfg.get("enabled", True)) if isinstance(cfg, dict) else True for name, cfg in self._agents.items()
+        }
+        self._enabled_agents: List[str] = [name for name, on in self._agent_enabled.items() if on]
+        # One walk over tasks yields the enabled set, each task's context names and the
+        # agent references of enabled tasks
+        enabled_tasks: set = set()
+        task_context: Dict[str, tuple] = {}
+        refs: List[tuple] = []
+        for t_name, t_cfg in self._tasks.items():
+            if not isinstance(t_cfg, dict):
+                enabled_tasks.add(t_name)
+                task_context[t_name] = ()
+                continue
+            # Normalize once so later lookups use the names as-is (str() only for non-str YAML values)
+            ctx = tuple(c if type(c) is str else str(c) for c in t_cfg.get("context") or ())
+            task_context[t_name] = ctx
+            if t_cfg.get("enabled", True):
+                enabled_tasks.add(t_name)
+                refs.append((t_name, str(t_cfg.get("agent", "")), ctx))
+        self._enabled_tasks: set = enabled_tasks
+        self._task_context: Dict[str, tuple] = task_context
+        # (task, agent ref, context refs that are missing or disabled) for crew() warnings
+        self._task_refs: List[tuple] = [
+            (t_name, agent_ref, [c for c in ctx if c not in enabled_tasks]) for t_name, agent_ref, ctx in refs
+        ]
+        self._task_order: List[str] = self._topological_task_order()
+        self._crew_kwargs_template, self._crew_kwargs_notices = self._make_crew_kwargs_template()
+        # Filled lazily: CrewBase populates agents_config/tasks_config only after __init__ returns
+        self._agent_specs: Dict[str, _AgentSpec] = {}
+        self._task_payloads: Dict[str, Dict[str, Any]] = {}
+
+    def _make_crew_kwargs_template(self) -> tuple:
+        """Return (Crew() kwargs fixed by the crew config, notices about them).
+
+        crew() overlays the per-build agents, tasks, knowledge sources and manager agent.
+        """
+        crew_cfg = self._crew_cfg
+        notices: List[str] = []
+        template: Dict[str, Any] = {
+            "process": Process.sequential if str(crew_cfg.process).lower() == "sequential" else Process.hierarchical,
+            "verbose": crew_cfg.verbose,
+            "planning": crew_cfg.planning,
+            "memory": crew_cfg.memory,
+            "knowledge": crew_cfg.knowledge or None,
+        }
+        # Always pass manager_llm (default set in config model)
+        manager_llm = getattr(crew_cfg, "manager_llm", None)
+        if manager_llm:
+            template["manager_llm"] = manager_llm
+
+        # Optional planning LLM support (alias string), compatible with different Crew versions
+        planning_llm = getattr(crew_cfg, "planning_llm", None)
+        if planning_llm:
+            if not _CREW_PARAMS:
+                notices.append("Could not introspect Crew fields/signature; defaulting to manager_llm")
+                template["manager_llm"] = planning_llm
+            elif _CREW_ACCEPTS_PLANNING_LLM:
+                template["planning_llm"] = planning_llm
+            elif _CREW_ACCEPTS_MANAGER_LLM:
+                template["manager_llm"] = planning_llm
+            else:
+                notices.append("planning_llm set in config, but Crew() has no planning_llm/manager_llm field; ignoring")
+        return template, notices
+
+    def _topological_task_order(self) -> List[str]:
+        """Return task names in YAML order, adjusted so context tasks are built first.
+
+        Kahn's algorithm with the YAML position as tie-breaker, so configs that are
+        already well ordered keep their order. Tasks on a context cycle are appended
+        in YAML order.
+        """
+        names = list(self._tasks.keys())
+        position = {n: i for i, n in enumerate(names)}
+        indegree = dict.fromkeys(names, 0)
+        dependents: Dict[str, List[str]] = {n: [] for n in names}
+        for n, ctx in self._task_context.items():
+            for dep in set(ctx):
+                if dep in position and dep != n:
+                    indegree[n] += 1
+                    dependents[dep].append(n)
+        ready = [position[n] for n in names if indegree[n] == 0]
+        heapq.heapify(ready)
+        order: List[str] = []
+        while ready:
+            n = names[heapq.heappop(ready)]
+            order.append(n)
+            for d in dependents[n]:
+                indegree[d] -= 1
+                if indegree[d] == 0:
+                    heapq.heappush(ready, position[d])
+        if len(order) < len(names):
+            placed = set(order)
+            order.extend(n for n in names if n not in placed)
+        return order
+
+    def _config_signature(self) -> tuple:
+        """Return (mtime_ns, size) for the YAML files the built Crew depends on."""
+        sig = []
+        for name in ("agents.yaml", "tasks.yaml", "crews.yaml"):
+            try:
+                st = os.stat(self.root / "config" / name)
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _resolve_tools(self, names: tuple) -> tuple:
+        """Resolve tool names (wildcards allowed) through the registry, once per name tuple.
+
+        Names are not sorted for the key: resolve() order is the order tools are shown
+        to the agent.
+        """
+        resolved = self._resolved_tools_cache.get(names)
+        if resolved is None:
+            resolved = self._resolved_tools_cache[names] = tuple(self._tool_registry.resolve(list(names)))
+        return resolved
 
     # === Agents === (built dynamically in crew() from YAML; no hardcoded @agent methods)
 
-    def _build_task_generic(self, name: str, agent_obj: Optional[Agent] = None, context_objs: Optional[List[Task]] = None, suppress_output_file: bool = False) -> Task:
-        """Build a Task from YAML config by name and optionally attach an Agent.
+    def _task_payload(self, name: str) -> Dict[str, Any]:
+        """Return the cleaned, validated Task config for `name`, computed on first use.
 
         Uses CrewBase-populated `self.tasks_config` when available as the base
         config. Removes YAML-only keys not supported by Task(), like 'enabled'.
-        If an `agent_obj` is provided, we attach it either via the Task() argument
-        (preferred) or by inserting into the config payload for compatibility
-        across CrewAI versions.
+        Callers must copy the result before mutating it.
         """
-        try:
-            base_src = dict(self.tasks_config.get(name, {}))  # type: ignore[attr-defined]
-        except Exception:
-            base_src = {}
-        payload = dict(base_src) if isinstance(base_src, dict) else {}
-        # Fallback to loader-parsed YAML if CrewBase didn't populate this task (e.g., renamed)
-        if not payload:
+        payload = self._task_payloads.get(name)
+        if payload is not None:
+            return payload
+        src = None
+        if not self._configs_reloaded:
             try:
-                fallback_src = dict(self._tasks.get(name, {}))
-            except Exception:
-                fallback_src = {}
-            if isinstance(fallback_src, dict) and fallback_src:
-                payload = dict(fallback_src)
-        # Strip keys that are not part of Task config API or that we'll control
-        payload.pop("enabled", None)
-        payload.pop("tools", None)  # keep task-level tools disabled (agent-level only)
+                src = self.tasks_config.get(name)  # type: ignore[attr-defined]
+            except AttributeError:
+                src = None
+        # Strip keys that are not part of Task config API or that we'll control;
+        # task-level tools stay disabled (agent-level only)
+        drop: tuple = ("enabled", "tools")
+        # Fallback to loader-parsed YAML after a reload, or if CrewBase didn't populate
+        # this task (e.g., renamed)
+        if not isinstance(src, dict) or not src:
+            src = self._tasks.get(name)
+            # Unmapped YAML holds agent/context names; crew() attaches those as objects
+            drop = ("enabled", "tools", "agent", "context")
+        payload = {k: v for k, v in src.items() if k not in drop} if isinstance(src, dict) else {}
+        # Validate required fields early to provide a clearer error
+        if "description" not in payload or "expected_output" not in payload:
+            raise ValueError(
+                f"Task '{name}' is incomplete or not found. Ensure it exists in config/tasks.yaml "
+                f"with 'description' and 'expected_output'. If you recently renamed it, update "
+                f"crews.yaml task_order for the selected crew and any 'context' references in other tasks."
+            )
+        # CrewBase invokes the @task wrappers while still mapping tasks_config during
+        # construction; only cache once that mapping is complete (first crew() call)
+        if self._configs_mapped:
+            self._task_payloads[name] = payload
+        return payload
+
+    def _build_task_generic(self, name: str, agent_obj: Optional[Agent] = None, context_objs: Optional[List[Task]] = None, suppress_output_file: bool = False) -> Task:
+        """Build a Task from YAML config by name and optionally attach an Agent.
+
+        Starts from a copy of the cached `_task_payload(name)`. If an `agent_obj`
+        is provided, we attach it either via the Task() argument (preferred) or by
+        inserting into the config payload for compatibility across CrewAI versions.
+        """
+        payload = self._task_payload(name).copy()
         if suppress_output_file:
             payload.pop("output_file", None)
         # Ensure we don't pass a stale string agent from YAML; we'll attach instance
         if agent_obj is not None:
             payload.pop("agent", None)
         # Decide how to attach the agent (constructor vs config injection)
-        use_ctor_agent = False
-        can_pass_context = False
-        try:
-            sig = inspect.signature(Task.__init__)
-            use_ctor_agent = (agent_obj is not None and ("agent" in sig.parameters))
-            can_pass_context = ("context" in sig.parameters)
-            can_pass_human = ("human_input" in sig.parameters)
-        except Exception:
-            use_ctor_agent = False
-            can_pass_context = False
-            can_pass_human = False
+        use_ctor_agent = agent_obj is not None and _TASK_ACCEPTS_AGENT
+        can_pass_context = _TASK_ACCEPTS_CONTEXT
+        can_pass_human = _TASK_ACCEPTS_HUMAN_INPUT
         if agent_obj is not None and not use_ctor_agent:
             # Compatibility: insert instance into config
             payload["agent"] = agent_obj  # type: ignore[assignment]
-        # Validate required fields early to provide a clearer error
-        if not isinstance(payload, dict) or "description" not in payload or "expected_output" not in payload:
-            raise ValueError(
-                f"Task '{name}' is incomplete or not found. Ensure it exists in config/tasks.yaml "
-                f"with 'description' and 'expected_output'. If you recently renamed it, update "
-                f"crews.yaml task_order for the selected crew and any 'context' references in other tasks."
-            )
         # Prepare optional kwargs supported by current CrewAI version
         optional_kwargs: Dict[str, Any] = {}
         if can_pass_human:
-            try:
-                human_val = payload.get("human_input", None)
-            except Exception:
-                human_val = None
+            human_val = payload.get("human_input", None)
             if human_val is not None:
                 optional_kwargs["human_input"] = human_val
 
@@ -138,208 +362,207 @@ class ConfigDrivenCrew:
     # Methods for YAML-defined tasks are synthesized dynamically in __init__ by
     # _ensure_dynamic_task_methods(); no static wrappers are necessary.
 
-    def _build_agent_generic(self, name: str) -> Agent:
-        """Build an Agent from YAML config by name.
+    def _agent_spec(self, name: str) -> _AgentSpec:
+        """Return the cached build inputs for agent `name`, extracting them on first use.
 
         Uses values from `self._agents[name]` as runtime overrides and
         falls back to the CrewBase-populated `self.agents_config[name]`.
         """
+        spec = self._agent_specs.get(name)
+        if spec is not None:
+            return spec
         cfg = self._agents.get(name, {})
 
-        # --- Helper: clone tools safely (avoid deepcopy issues with locks/RLocks) ---
-        def _safe_clone_tool(obj: Any) -> Any:
-            try:
-                return copy.deepcopy(obj)
-            except Exception:
-                try:
-                    # Shallow copy preserves internal locks by reference and avoids pickling
-                    return copy.copy(obj)
-                except Exception:
-                    # As a last resort, reuse the same instance (most tools are stateless)
-                    return obj
-
-        # Build tools with support for per-agent flags (e.g., result_as_answer)
-        tools: List[Any] = []
         tools_cfg = cfg.get("tools", None)
-        tool_names_legacy = cfg.get("tool_names", None)
+        tool_items: tuple = ()
+        tool_names: tuple = ()
         if isinstance(tools_cfg, list) and tools_cfg:
-            for item in tools_cfg:
-                if isinstance(item, str):
-                    # Support wildcard resolution; deep-copy to avoid shared state across agents
-                    resolved = self._tool_registry.resolve([item])
-                    tools.extend(_safe_clone_tool(t) for t in resolved)
-                elif isinstance(item, dict) and "name" in item:
-                    resolved = self._tool_registry.resolve([str(item["name"])])
-                    for base_tool in resolved:
-                        inst = _safe_clone_tool(base_tool)
-                        # Apply supported per-tool flags
-                        if "result_as_answer" in item:
-                            try:
-                                setattr(inst, "result_as_answer", bool(item["result_as_answer"]))
-                            except Exception:
-                                # Best-effort; ignore if tool doesn't support the attribute
-                                pass
-                        tools.append(inst)
-                else:
-                    # Unknown entry type; skip silently to be permissive
-                    continue
+            tool_items = tuple(tools_cfg)
         else:
             # Legacy support: simple list of names in 'tool_names' or 'tools'
-            names = tool_names_legacy or cfg.get("tools", [])
+            names = cfg.get("tool_names", None) or cfg.get("tools", [])
             if isinstance(names, list) and names:
-                resolved = self._tool_registry.resolve(names)
-                tools = [_safe_clone_tool(t) for t in resolved]
+                tool_names = tuple(str(n) for n in names)
 
-        # Base agent configuration from CrewBase-loaded YAML if available
-        try:
-            base_src = dict(self.agents_config.get(name, {}))  # type: ignore[attr-defined]
-        except Exception:
+        # Base agent configuration from CrewBase-loaded YAML if available; after a
+        # reload that copy is stale and the loader config below is used instead
+        base_src: Any = {}
+        if not self._configs_reloaded:
+            try:
+                base_src = self.agents_config.get(name, {})  # type: ignore[attr-defined]
+            except AttributeError:
+                # agents_config is still the YAML path string until CrewBase loads it
+                base_src = {}
+        if not isinstance(base_src, dict):
             base_src = {}
-        base_cfg = dict(base_src) if isinstance(base_src, dict) else {}
-        base_cfg.pop("tools", None)
-        base_cfg.pop("tool_names", None)
-        base_cfg.pop("enabled", None)
+        base_cfg = {k: v for k, v in base_src.items() if k not in _AGENT_CONFIG_EXCLUDE}
         # Build config payload, falling back to cleaned per-run cfg when base is absent
         if base_cfg:
             config_payload = base_cfg
+        elif isinstance(cfg, dict):
+            config_payload = {k: v for k, v in cfg.items() if k not in _AGENT_CONFIG_EXCLUDE}
         else:
-            cfg_clean = dict(cfg) if isinstance(cfg, dict) else {}
-            for k in ("tools", "tool_names", "enabled"):
-                cfg_clean.pop(k, None)
-            config_payload = cfg_clean
+            config_payload = {}
         # Ensure a stable name for mapping tasks->agents
-        if isinstance(config_payload, dict) and "name" not in config_payload:
+        if "name" not in config_payload:
             config_payload["name"] = name
 
-        # Optional fields
-        cache_val = cfg.get("cache", base_cfg.pop("cache", None))
-        human_input_val = cfg.get("human_input", base_cfg.pop("human_input", None))
-        allow_code_execution_val = cfg.get("allow_code_execution", base_cfg.pop("allow_code_execution", None))
-        multimodal_val = cfg.get("multimodal", base_cfg.pop("multimodal", None))
-        max_rpm_val = cfg.get("max_rpm", base_cfg.pop("max_rpm", None))
-        max_iter_val = cfg.get("max_iter", base_cfg.pop("max_iter", None))
-        llm_temperature_val = cfg.get("llm_temperature", base_cfg.pop("llm_temperature", None))
-
-        agent_kwargs = {
-            "config": config_payload,
-            "verbose": bool(cfg.get("verbose", True)),
-            "tools": tools,
-        }
-        if cache_val is not None:
-            agent_kwargs["cache"] = cache_val
-        if human_input_val is not None:
-            agent_kwargs["human_input"] = human_input_val
-        if allow_code_execution_val is not None:
-            agent_kwargs["allow_code_execution"] = allow_code_execution_val
-        if multimodal_val is not None:
-            agent_kwargs["multimodal"] = multimodal_val
-        if max_rpm_val is not None:
-            agent_kwargs["max_rpm"] = max_rpm_val
-        if max_iter_val is not None:
-            agent_kwargs["max_iter"] = max_iter_val
-        if llm_temperature_val is not None:
-            agent_kwargs["llm_temperature"] = llm_temperature_val
-        return Agent(**agent_kwargs)
+        spec = _AgentSpec(
+            config=config_payload,
+            tool_items=tool_items,
+            tool_names=tool_names,
+            verbose=bool(cfg.get("verbose", True)),
+            # Optional fields are passed as Agent() kwargs, read from the unfiltered configs
+            options={k: v for k in _OPTIONAL_AGENT_KEYS if (v := cfg.get(k, base_src.get(k))) is not None},
+        )
+        self._agent_specs[name] = spec
+        return spec
+
+    def _build_agent_generic(self, name: str) -> Agent:
+        """Build a fresh Agent for `name`.
+
+        Agents are never shared between crews: kickoff attaches the crew, executor and
+        knowledge to them, so concurrent runs (e.g. scheduler jobs) must not reuse one.
+        """
+        return self._new_agent(self._agent_spec(name))
+
+    def _new_agent(self, spec: _AgentSpec) -> Agent:
+        """Construct a fresh Agent from `spec`."""
+        # --- Helper: clone tools safely (avoid deepcopy issues with locks/RLocks) ---
+        def _safe_clone_tool(obj: Any) -> Any:
+            try:
+                return copy.deepcopy(obj)
+            except Exception:
+                try:
+                    # Shallow copy preserves internal locks by reference and avoids pickling
+                    return copy.copy(obj)
+                except Exception:
+                    # As a last resort, reuse the same instance (most tools are stateless)
+                    return obj
+
+        # Build tools with support for per-agent flags (e.g., result_as_answer)
+        tools: List[Any] = []
+        for item in spec.tool_items:
+            if isinstance(item, str):
+                # Support wildcard resolution; deep-copy to avoid shared state across agents
+                resolved = self._resolve_tools((item,))
+                tools.extend(_safe_clone_tool(t) for t in resolved)
+            elif isinstance(item, dict) and "name" in item:
+                resolved = self._resolve_tools((str(item["name"]),))
+                for base_tool in resolved:
+                    inst = _safe_clone_tool(base_tool)
+                    # Apply supported per-tool flags
+                    if "result_as_answer" in item:
+                        try:
+                            setattr(inst, "result_as_answer", bool(item["result_as_answer"]))
+                        except Exception:
+                            # Best-effort; ignore if tool doesn't support the attribute
+                            pass
+                    tools.append(inst)
+            # Unknown entry types are skipped silently to be permissive
+        if spec.tool_names:
+            tools = [_safe_clone_tool(t) for t in self._resolve_tools(spec.tool_names)]
+
+        # Copy the payload so each Agent owns its config dict
+        return Agent(config=dict(spec.config), verbose=spec.verbose, tools=tools, **spec.options)
 
     @crew
     def crew(self) -> Crew:
-        # Build agents, preferring an explicit crew-level allowlist when provided
-        agents_list: List[Agent] = []
-        built_by_name: Dict[str, Agent] = {}
-        crew_agent_names: List[str] = []
+        return self._new_crew()
+
+    def _new_crew(self) -> Crew:
+        """Build a new Crew from the current configs.
+
+        CrewAI memoizes the @crew method per instance, so rebuilds after a config
+        reload call this directly.
+        """
+        self._configs_mapped = True
+        # Notices are batched into a single print, emitted even if the build fails
+        notices: List[str] = []
         try:
-            crew_agent_names = list(getattr(self._crew_cfg, "agents", []) or [])
-        except Exception:
-            crew_agent_names = []
+            return self._build_crew(notices)
+        finally:
+            _print_notices(notices)
+
+    def _build_crew(self, notices: List[str]) -> Crew:
+        """Build the Crew from YAML configs, appending user-facing notices to `notices`."""
+        # Bind the crew config and its fields once; pydantic attribute access isn't free
+        crew_cfg = self._crew_cfg
+        is_sequential = str(crew_cfg.process).lower() == "sequential"
+        manager_llm = getattr(crew_cfg, "manager_llm", None)
+        manager_agent_name = getattr(crew_cfg, "manager_agent", None)
+        # Resolve crew agents, preferring an explicit crew-level allowlist when provided
+        candidate_names: List[str] = []
+        crew_agent_names: List[str] = list(getattr(crew_cfg, "agents", []) or [])
         if crew_agent_names:
-            # Only build the explicitly selected agents
+            # Only consider the explicitly selected agents
             for name in crew_agent_names:
-                if name not in self._agents:
-                    console.print(f"[yellow]Warning: crew.agents includes unknown agent '{name}'[/yellow]")
+                enabled = self._agent_enabled.get(name)
+                if enabled is None:
+                    notices.append(f"Warning: crew.agents includes unknown agent '{name}'")
                     continue
-                cfg = self._agents.get(name, {})
                 # Respect per-agent enabled flag too
-                if not bool(cfg.get("enabled", True)):
-                    console.print(f"[yellow]Warning: agent '{name}' is disabled but referenced by crew.agents[/yellow]")
-                    continue
-                agent_obj = self._build_agent_generic(name)
-                built_by_name[name] = agent_obj
-                agents_list.append(agent_obj)
-        else:
-            # Default behavior: build all enabled agents from YAML
-            for name, cfg in self._agents.items():
-                try:
-                    enabled = bool(cfg.get("enabled", True)) if isinstance(cfg, dict) else True
-                except Exception:
-                    enabled = True
                 if not enabled:
+                    notices.append(f"Warning: agent '{name}' is disabled but referenced by crew.agents")
                     continue
-                agent_obj = self._build_agent_generic(name)
-                built_by_name[name] = agent_obj
-                agents_list.append(agent_obj)
+                candidate_names.append(name)
+        else:
+            # Default behavior: all enabled agents from YAML
+            candidate_names = list(self._enabled_agents)
+
+        # Every lookup, including the manager and agents outside crew.agents, goes through
+        # _get_or_build_agent so an agent is built at most once per crew().
+        built_by_name: Dict[str, Agent] = {}
+
+        def _get_or_build_agent(name: str) -> Agent:
+            agent_obj = built_by_name.get(name)
+            if agent_obj is None:
+                agent_obj = built_by_name[name] = self._build_agent_generic(name)
+            return agent_obj
+
+        # All crew agents are passed to Crew() even when no task maps to them: they are
+        # delegation targets (and the hierarchical manager's pool)
+        for name in candidate_names:
+            _get_or_build_agent(name)
 
         # Optional manager agent by name from config; ensure present even if disabled
-        manager_agent_name = getattr(self._crew_cfg, "manager_agent", None)
         manager_agent_obj = None
         # Build enabled agents names for validation without relying on Agent attributes
-        enabled_agent_names = set(built_by_name.keys())
-        enabled_task_names = {t_name for t_name, t_cfg in self._tasks.items() if bool(t_cfg.get("enabled", True))}
-        for t_name, t_cfg in self._tasks.items():
-            if not bool(t_cfg.get("enabled", True)):
-                continue
-            agent_ref = str(t_cfg.get("agent", ""))
+        enabled_agent_names = set(candidate_names)
+        for t_name, agent_ref, missing_ctx in self._task_refs:
             if agent_ref and agent_ref not in enabled_agent_names:
-                console.print(f"[yellow]Warning: Task '{t_name}' references agent '{agent_ref}' which is missing or disabled[/yellow]")
-            # Validate context task references
-            context_tasks = t_cfg.get("context", [])
-            for ctx_task in context_tasks:
-                if str(ctx_task) not in enabled_task_names:
-                    console.print(f"[yellow]Warning: Task '{t_name}' references context task '{ctx_task}' which is missing or disabled[/yellow]")
+                notices.append(f"Warning: Task '{t_name}' references agent '{agent_ref}' which is missing or disabled")
+            for ctx_task in missing_ctx:
+                notices.append(f"Warning: Task '{t_name}' references context task '{ctx_task}' which is missing or disabled")
 
         if manager_agent_name:
-            manager_agent_obj = built_by_name.get(str(manager_agent_name))
-            if manager_agent_obj is None:
-                manager_agent_obj = self._build_agent_generic(str(manager_agent_name))
-                if all(a is not manager_agent_obj for a in agents_list):
-                    agents_list.append(manager_agent_obj)
+            manager_agent_obj = _get_or_build_agent(str(manager_agent_name))
 
         # Build tasks dynamically from YAML using crew-level order and mapping
         tasks_list: List[Task] = []
         # Determine task order preference
-        try:
-            preferred_order: List[str] = list(getattr(self._crew_cfg, "task_order", []) or [])
-        except Exception:
-            preferred_order = []
-        # Build a working list of (name, cfg) preserving YAML order
-        yaml_order: List[str] = [t_name for t_name, _ in self._tasks.items()]
-        order = preferred_order if preferred_order else yaml_order
+        preferred_order: List[str] = list(getattr(crew_cfg, "task_order", []) or [])
+        # Without an explicit task_order, use the cached dependency-respecting YAML order
+        order = preferred_order if preferred_order else self._task_order
         # Build mapping from task -> agent name(s); allow string or list values
-        try:
-            task_agent_map: Dict[str, Any] = dict(getattr(self._crew_cfg, "task_agent_map", {}) or {})
-        except Exception:
-            task_agent_map = {}
-
-        # Precompute enabled task names from YAML for validation
-        enabled_task_names = {t_name for t_name, t_cfg in self._tasks.items() if bool(t_cfg.get("enabled", True))}
+        task_agent_map: Dict[str, Any] = {
+            sys.intern(str(k)): v for k, v in (getattr(crew_cfg, "task_agent_map", {}) or {}).items()
+        }
 
         # Track built Task objects by base name for resolving YAML context to Task instances
         built_tasks_by_name: Dict[str, List[Task]] = {}
 
-        def _resolve_context_objs(names: List[str]) -> List[Task]:
+        def _resolve_context_objs(names: tuple) -> List[Task]:
             out: List[Task] = []
             for nm in names:
-                try:
-                    lst = built_tasks_by_name.get(str(nm), [])
-                    if lst:
-                        out.append(lst[-1])
-                except Exception:
-                    continue
+                lst = built_tasks_by_name.get(nm)
+                if lst:
+                    out.append(lst[-1])
             return out
 
         for t_name in order:
-            t_cfg = self._tasks.get(t_name)
-            if t_cfg is None:
-                console.print(f"[yellow]Warning: crew.task_order includes unknown task '{t_name}'[/yellow]")
+            if t_name not in self._task_context:
+                notices.append(f"Warning: crew.task_order includes unknown task '{t_name}'")
                 continue
             # Determine agents for this task (single or list)
             mapping_val = task_agent_map.get(t_name, None)
@@ -350,12 +573,10 @@ class ConfigDrivenCrew:
                 agent_names = [mapping_val.strip()]
             else:
                 # Default to the first crew agent to satisfy Crew validation in sequential process
-                if agents_list:
-                    # Try to get the first agent's declared name
-                    first_cfg = getattr(agents_list[0], "config", {}) or {}
-                    first_name = first_cfg.get("name") or next(iter(built_by_name.keys()), "")
+                if candidate_names:
+                    first_name = candidate_names[0]
                     if first_name:
-                        console.print(f"[yellow]Note: no agent mapping for task '{t_name}'; defaulting to first crew agent '{first_name}'[/yellow]")
+                        notices.append(f"Note: no agent mapping for task '{t_name}'; defaulting to first crew agent '{first_name}'")
                         agent_names = [str(first_name)]
                     else:
                         agent_names = []
@@ -363,8 +584,7 @@ class ConfigDrivenCrew:
                     agent_names = []
 
             # Resolve YAML-declared context names to built Task objects (latest instances)
-            declared_ctx_names: List[str] = list(t_cfg.get("context", []) or [])
-            base_ctx_objs: List[Task] = _resolve_context_objs(declared_ctx_names)
+            base_ctx_objs: List[Task] = _resolve_context_objs(self._task_context[t_name])
 
             # Build one or more concrete tasks based on agent_names. If multiple,
             # chain them so each subsequent clone receives the previous clone as context.
@@ -376,17 +596,15 @@ class ConfigDrivenCrew:
                 continue
 
             for idx, agent_name in enumerate(agent_names):
-                agent_obj = built_by_name.get(agent_name)
-                if agent_obj is None:
-                    # If agent wasn't pre-built (not in crew.agents), try to build it to avoid a hard failure
-                    agent_cfg = self._agents.get(agent_name, {})
-                    if agent_cfg and bool(agent_cfg.get("enabled", True)):
-                        console.print(f"[yellow]Note: building agent '{agent_name}' referenced by task '{t_name}' but not listed in crew.agents[/yellow]")
-                        agent_obj = self._build_agent_generic(agent_name)
-                        built_by_name[agent_name] = agent_obj
-                        agents_list.append(agent_obj)
+                if agent_name in enabled_agent_names or agent_name in built_by_name:
+                    agent_obj = _get_or_build_agent(agent_name)
+                else:
+                    # If agent isn't a crew agent (not in crew.agents), try to build it to avoid a hard failure
+                    if self._agent_enabled.get(agent_name, False):
+                        notices.append(f"Note: building agent '{agent_name}' referenced by task '{t_name}' but not listed in crew.agents")
+                        agent_obj = _get_or_build_agent(agent_name)
                     else:
-                        console.print(f"[yellow]Warning: Task '{t_name}' references agent '{agent_name}' which is missing or disabled[/yellow]")
+                        notices.append(f"Warning: Task '{t_name}' references agent '{agent_name}' which is missing or disabled")
                         continue
 
                 ctx_objs: List[Task] = list(base_ctx_objs)
@@ -416,80 +634,50 @@ class ConfigDrivenCrew:
         # - [] (empty list)    => use none
         # - ["ALL"]            => use all available (explicit)
         # - [list of names]    => use only those
-        selected_sources = getattr(self._crew_cfg, 'knowledge_sources', None)
+        selected_sources = getattr(crew_cfg, 'knowledge_sources', None)
         if isinstance(selected_sources, list) and any(str(s).upper() == "ALL" for s in selected_sources):
             selected_sources = None
         knowledge_sources = load_knowledge_config(self.root, selected_sources=selected_sources)
         
+        # Built agents in first-use order (includes the manager, as before)
+        agents_list: List[Agent] = list(built_by_name.values())
         crew_kwargs = {
+            **self._crew_kwargs_template,
             "agents": agents_list,
             "tasks": tasks_list,
-            "process": Process.sequential if str(self._crew_cfg.process).lower() == "sequential" else Process.hierarchical,
-            "verbose": self._crew_cfg.verbose,
-            "planning": self._crew_cfg.planning,
-            "memory": self._crew_cfg.memory,
-            "knowledge": self._crew_cfg.knowledge or None,
             "knowledge_sources": knowledge_sources,
         }
         if manager_agent_obj is not None:
             crew_kwargs["manager_agent"] = manager_agent_obj
-        # Always pass manager_llm (default set in config model)
-        if getattr(self._crew_cfg, "manager_llm", None):
-            crew_kwargs["manager_llm"] = self._crew_cfg.manager_llm
-
-        # Optional planning LLM support (alias string), compatible with different Crew versions
-        if getattr(self._crew_cfg, "planning_llm", None):
-            try:
-                # Prefer Pydantic model field introspection (Crew is a Pydantic model)
-                field_names: list[str] = []
-                try:
-                    mf = getattr(Crew, "model_fields", None)
-                    if isinstance(mf, dict):
-                        field_names = list(mf.keys())
-                    else:
-                        legacy = getattr(Crew, "__fields__", None)
-                        if isinstance(legacy, dict):
-                            field_names = list(legacy.keys())
-                except Exception:
-                    field_names = []
-
-                if field_names:
-                    if "planning_llm" in field_names:
-                        crew_kwargs["planning_llm"] = self._crew_cfg.planning_llm
-                    elif "manager_llm" in field_names:
-                        crew_kwargs["manager_llm"] = self._crew_cfg.planning_llm
-                    else:
-                        console.print(
-                            "[yellow]planning_llm set in config, but Crew() model has no planning_llm/manager_llm field; ignoring[/yellow]"
-                        )
-                else:
-                    # Fallback: try signature-based detection for non-Pydantic implementations
-                    sig = inspect.signature(Crew.__init__)
-                    if "planning_llm" in sig.parameters:
-                        crew_kwargs["planning_llm"] = self._crew_cfg.planning_llm
-                    elif "manager_llm" in sig.parameters:
-                        crew_kwargs["manager_llm"] = self._crew_cfg.planning_llm
-                    else:
-                        console.print(
-                            "[yellow]planning_llm set in config, but Crew() does not accept planning_llm/manager_llm in this version; ignoring[/yellow]"
-                        )
-            except Exception as e:  # noqa: BLE001
-                console.print(
-                    f"[yellow]Could not introspect Crew fields/signature ({e}); defaulting to manager_llm[/yellow]"
-                )
-                crew_kwargs["manager_llm"] = self._crew_cfg.planning_llm
+        notices.extend(self._crew_kwargs_notices)
 
         # Enforce hierarchical requirement: either manager_agent or manager_llm must be provided
-        if str(self._crew_cfg.process).lower() == "hierarchical":
-            if manager_agent_obj is None and not getattr(self._crew_cfg, "manager_llm", None):
-                raise ValueError("Either manager_agent or manager_llm must be set when using the hierarchical process.")
+        if not is_sequential and manager_agent_obj is None and not manager_llm:
+            raise ValueError("Either manager_agent or manager_llm must be set when using the hierarchical process.")
 
         return Crew(**crew_kwargs)
 
     async def kickoff_async(self, inputs: dict) -> CrewOutput:
-        """Kick off the configured crew asynchronously."""
-        c = self.crew()
-        return await c.kickoff_async(inputs=inputs)
+        """Kick off the configured crew asynchronously.
+
+        The built Crew is reused across calls; it is rebuilt (with configs reloaded)
+        only when agents/tasks/crews YAML files change on disk. After a reload, agents
+        and tasks are built from the freshly loaded YAML rather than CrewBase's copy.
+        """
+        sig = self._config_signature()
+        if sig != self._config_sig:
+            self._load_configs()
+            self._configs_reloaded = True
+            self._tool_registry = registry(self.root, self._crew_cfg.tools_files)
+            self._resolved_tools_cache.clear()
+            self._index_configs()
+            self._ensure_dynamic_task_methods()
+            self._config_sig = sig
+            self._crew_instance = None
+        if self._crew_instance is None:
+            # self.crew() is memoized and would return the pre-reload Crew
+            self._crew_instance = self._new_crew() if self._configs_reloaded else self.crew()
+        return await self._crew_instance.kickoff_async(inputs=inputs)
 
     # ---------- Internal Utilities ----------
     def _ensure_dynamic_task_methods(self) -> None:
@@ -499,19 +687,37 @@ class ConfigDrivenCrew:
         To keep the template fully configuration-driven while preserving `context`
         behavior, we synthesize thin wrappers that delegate to `_build_task_generic`.
         """
-        for t_name in list(self._tasks.keys()):
-            if hasattr(self.__class__, t_name):
-                continue
-            # Create a new method bound to the class; default arg captures current name
-            def _factory(name: str = t_name):  # noqa: ANN001
-                def _dyn(self) -> Task:  # type: ignore[override]
+        cls = self.__class__
+        names = frozenset(self._tasks)
+        # Fast path: every current task already got its wrapper on an earlier construction
+        if names <= cls._dynamic_tasks_attached:
+            return
+        with cls._dynamic_tasks_lock:
+            self._attach_task_methods([n for n in self._tasks if n not in cls._dynamic_tasks_attached])
+            cls._dynamic_tasks_attached = cls._dynamic_tasks_attached | names
+
+    def _attach_task_methods(self, names: List[str]) -> None:
+        """Attach a @task wrapper for each name (YAML order) not already on the class.
+
+        Wrappers for identifier-safe names are compiled in one exec() with the task name
+        baked in as a constant; other names (e.g. 'write-report') use a closure.
+        """
+        cls = self.__class__
+        missing = [n for n in names if not hasattr(cls, n)]
+        codegen = [n for n in missing if n.isidentifier() and not keyword.iskeyword(n)]
+        generated: Dict[str, Any] = {"__name__": __name__}
+        if codegen:
+            src = "\n".join(f"def {n}(self):\n    return self._build_task_generic({n!r})\n" for n in codegen)
+            exec(compile(src, "<crew_composer dynamic tasks>", "exec"), generated)  # noqa: S102
+
+        for t_name in missing:
+            fn = generated.get(t_name)
+            if fn is None:
+                # Create a new method bound to the class; default arg captures current name
+                def _dyn(self, name: str = t_name) -> Task:  # type: ignore[override]
                     return self._build_task_generic(name)
                 # Ensure function name matches the task name for maximum compatibility
-                try:
-                    _dyn.__name__ = name  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-                decorated = task(_dyn)
-                return decorated
-            setattr(self.__class__, t_name, _factory())
+                _dyn.__name__ = t_name
+                fn = _dyn
+            setattr(cls, t_name, task(fn))
 
@@ -2,29 +2,66 @@
 
 from __future__ import annotations
 
-import json
+import importlib
+import logging
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
 
 # Note: pandas is optional for CSV/Excel support - will use basic file handling
-import yaml
-from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
-from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
-from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
-from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
-from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
-from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
-from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from rich.console import Console
 
+from .config_loader import load_yaml_file
+
+if TYPE_CHECKING:
+    from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+    from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+    from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
+    from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+    from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
+    from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+    from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Knowledge source classes are imported on first use: several pull in heavy optional
+# dependencies (pandas, openpyxl, pdf libraries) that most configs never need.
+_SOURCE_MODULES: Dict[str, str] = {
+    "StringKnowledgeSource": "crewai.knowledge.source.string_knowledge_source",
+    "TextFileKnowledgeSource": "crewai.knowledge.source.text_file_knowledge_source",
+    "PDFKnowledgeSource": "crewai.knowledge.source.pdf_knowledge_source",
+    "CSVKnowledgeSource": "crewai.knowledge.source.csv_knowledge_source",
+    "ExcelKnowledgeSource": "crewai.knowledge.source.excel_knowledge_source",
+    "JSONKnowledgeSource": "crewai.knowledge.source.json_knowledge_source",
+}
+_SOURCE_CLS: Dict[str, type] = {}
+
+# Shared per-type part of source metadata; each source gets its own copy
+_TYPE_META: Dict[str, Dict[str, str]] = {
+    t: {"type": sys.intern(t)}
+    for t in ("string", "text_file", "pdf", "csv", "excel", "json", "web_content")
+}
+
+
+def _source_cls(class_name: str) -> type:
+    """Return a CrewAI knowledge source class, importing its module on first use."""
+    cls = _SOURCE_CLS.get(class_name)
+    if cls is None:
+        module = importlib.import_module(_SOURCE_MODULES[class_name])
+        cls = _SOURCE_CLS[class_name] = getattr(module, class_name)
+    return cls
 
 
 class KnowledgeSourceConfig(BaseModel):
     """Configuration for a knowledge source."""
     
+    # Validated once and shared via the config cache; read-only afterwards
+    model_config = ConfigDict(frozen=True, extra="ignore", revalidate_instances="never")
+    
     # Optional; if omitted we fall back to the YAML key
     name: Optional[str] = None
     type: str
@@ -48,9 +85,17 @@ class KnowledgeSourceConfig(BaseModel):
 class KnowledgeSourcesConfig(BaseModel):
     """Configuration for all knowledge sources."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore", revalidate_instances="never")
+    
     knowledge_sources: Dict[str, KnowledgeSourceConfig] = Field(default_factory=dict)
 
 
+# Validated config per file path, stored with the parse it was built from. config_loader
+# returns the same cached parse while the file is unchanged, so an identity check is the
+# only freshness test needed here.
+_VALIDATED_CFG_CACHE: Dict[str, tuple[Dict[str, Any], KnowledgeSourcesConfig]] = {}
+
+
 class KnowledgeLoader:
     """Handles loading and managing knowledge sources from YAML configuration."""
     
@@ -58,6 +103,11 @@ class KnowledgeLoader:
         self.root = root_path
         self.knowledge_dir = root_path / "knowledge"
         self.knowledge_dir.mkdir(exist_ok=True)
+        # Resolved once; per-source paths are then handled with string operations
+        self._root_str = str(self.root.resolve())
+        self._kdir_str = str(self.knowledge_dir.resolve()) + os.sep
+        # Names of files directly under knowledge/, filled by one scandir on first use
+        self._known_files: Optional[frozenset[str]] = None
     
     def load_knowledge_sources(self, config_path: Optional[Path] = None, 
                                selected_sources: Optional[List[str]] = None) -> List[BaseKnowledgeSource]:
@@ -70,10 +120,14 @@ class KnowledgeLoader:
             return []
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f) or {}
-            
-            config = KnowledgeSourcesConfig.model_validate(raw_config)
+            # Validation only reads the parse and builds frozen models, so no copy is needed
+            raw_config = load_yaml_file(config_path)
+            cached = _VALIDATED_CFG_CACHE.get(str(config_path))
+            if cached is not None and cached[0] is raw_config:
+                config = cached[1]
+            else:
+                config = KnowledgeSourcesConfig.model_validate(raw_config)
+                _VALIDATED_CFG_CACHE[str(config_path)] = (raw_config, config)
             return self._create_knowledge_sources(config, selected_sources)
             
         except Exception as e:
@@ -81,30 +135,55 @@ class KnowledgeLoader:
             return []
     
     def _create_knowledge_sources(self, config: KnowledgeSourcesConfig, 
-                                  selected_sources: Optional[List[str]] = None) -> List[BaseKnowledgeSource]:
+                                  selected_sources: Optional[Iterable[str]] = None) -> List[BaseKnowledgeSource]:
         """Create knowledge source instances from configuration with filtering."""
         sources = []
         
         # If no specific sources selected, use all available
         if selected_sources is None:
-            selected_sources = list(config.knowledge_sources.keys())
+            items = list(config.knowledge_sources.items())
+        else:
+            # Set membership keeps filtering linear; iteration stays in config order
+            selected = frozenset(selected_sources)
+            items = [(n, c) for n, c in config.knowledge_sources.items() if n in selected]
+            if logger.isEnabledFor(logging.DEBUG):
+                skipped = [n for n in config.knowledge_sources if n not in selected]
+                if skipped:
+                    logger.debug("Skipping knowledge sources (not in selection): %s", ", ".join(skipped))
         
-        for name, source_config in config.knowledge_sources.items():
-            # Skip sources not in the selection list
-            if name not in selected_sources:
-                console.print(f"[dim]Skipping knowledge source: {name} (not in selection)[/dim]")
-                continue
-                
-            try:
-                source = self._create_knowledge_source(name, source_config)
-                if source:
-                    sources.append(source)
-                    console.print(f"[green]Loaded knowledge source: {name}[/green]")
-            except Exception as e:
-                console.print(f"[red]Error creating knowledge source '{name}': {e}[/red]")
+        if not items:
+            return sources
+        
+        # Construction is I/O-bound (stat plus CrewAI reading/parsing files), so build
+        # sources concurrently; results are reported in config order afterwards.
+        if len(items) == 1:
+            outcomes = [self._try_create_knowledge_source(*items[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+                outcomes = list(executor.map(lambda item: self._try_create_knowledge_source(*item), items))
+        
+        loaded = []
+        for (name, _), (source, error) in zip(items, outcomes):
+            if error is not None:
+                console.print(f"[red]Error creating knowledge source '{name}': {error}[/red]")
+            elif source:
+                sources.append(source)
+                loaded.append(name)
+        
+        if loaded:
+            console.print(f"[green]Loaded {len(loaded)} knowledge source(s): {', '.join(loaded)}[/green]")
         
         return sources
     
+    def _try_create_knowledge_source(
+        self, name: str, config: KnowledgeSourceConfig
+    ) -> tuple[Optional[BaseKnowledgeSource], Optional[Exception]]:
+        """Create a knowledge source, returning (source, error) instead of raising."""
+        try:
+            return self._create_knowledge_source(name, config), None
+        except Exception as e:
+            return None, e
+    
     def _create_knowledge_source(
         self, 
         name: str, 
@@ -114,32 +193,54 @@ class KnowledgeLoader:
         
         source_name = config.name or name
         
-        if config.type == "string":
-            return self._create_string_source(source_name, config)
-        elif config.type == "text_file":
-            return self._create_text_file_source(source_name, config)
-        elif config.type == "pdf":
-            return self._create_pdf_source(source_name, config)
-        elif config.type == "csv":
-            return self._create_csv_source(source_name, config)
-        elif config.type == "excel":
-            return self._create_excel_source(source_name, config)
-        elif config.type == "json":
-            return self._create_json_source(source_name, config)
-        elif config.type == "web_content":
-            return self._create_web_content_source(source_name, config)
-        else:
+        create = self._DISPATCH.get(config.type)
+        if create is None:
             console.print(f"[yellow]Unsupported knowledge source type: {config.type}[/yellow]")
             return None
+        return create(self, source_name, config)
 
-    def _normalize_to_knowledge_rel(self, path_str: str) -> str:
-        """Return a path relative to knowledge/ when inside it, else absolute string."""
-        file_path = (self.root / path_str).resolve() if not Path(path_str).is_absolute() else Path(path_str).resolve()
+    @classmethod
+    def register_type(
+        cls,
+        type_name: str,
+        create: Callable[["KnowledgeLoader", str, KnowledgeSourceConfig], Optional[BaseKnowledgeSource]],
+    ) -> None:
+        """Register (or replace) the factory used for knowledge sources of `type_name`."""
+        cls._DISPATCH[type_name] = create
+
+    def _resolve(self, path_str: str) -> tuple[str, str]:
+        """Return (absolute path, path to pass to CrewAI) for a configured path.
+
+        The second item is relative to knowledge/ when the file lives inside it,
+        else the absolute path.
+        """
+        abs_path = os.path.normpath(os.path.join(self._root_str, path_str))
+        if abs_path.startswith(self._kdir_str):
+            return abs_path, abs_path[len(self._kdir_str):]
+        return abs_path, abs_path
+
+    def _knowledge_paths(self, paths: List[str], label: str) -> List[str]:
+        """Map configured paths for CrewAI, checking that the first one exists (best-effort)."""
+        resolved = [self._resolve(p) for p in paths]
+        first_abs, first_use = resolved[0]
+        # Bare file names under knowledge/ are checked against one directory scan
+        if first_use != first_abs and os.sep not in first_use and first_use in self._knowledge_files():
+            return [use for _, use in resolved]
         try:
-            rel = file_path.relative_to(self.knowledge_dir)
-            return str(rel)
-        except ValueError:
-            return str(file_path)
+            os.stat(first_abs)
+        except OSError:
+            raise FileNotFoundError(f"{label} not found: {first_abs}") from None
+        return [use for _, use in resolved]
+
+    def _knowledge_files(self) -> frozenset[str]:
+        """Return the names of regular files directly under knowledge/ (scanned once)."""
+        if self._known_files is None:
+            try:
+                with os.scandir(self._kdir_str) as it:
+                    self._known_files = frozenset(e.name for e in it if e.is_file())
+            except OSError:
+                self._known_files = frozenset()
+        return self._known_files
 
     def _prefer_file_paths(self, cls, single_kw_name: str, file_paths: List[str], **kwargs):
         """Try to instantiate source with file_paths, fallback to legacy single path kw on TypeError."""
@@ -154,9 +255,9 @@ class KnowledgeLoader:
         if not config.content:
             raise ValueError("String knowledge source requires 'content'")
         
-        return StringKnowledgeSource(
+        return _source_cls("StringKnowledgeSource")(
             content=config.content,
-            metadata={"name": source_name, "type": "string"}
+            metadata=dict(_TYPE_META["string"], name=source_name)
         )
     
     def _create_text_file_source(self, source_name: str, config: KnowledgeSourceConfig) -> TextFileKnowledgeSource:
@@ -164,17 +265,13 @@ class KnowledgeLoader:
         paths = config.file_paths or ([config.file_path] if config.file_path else None)
         if not paths:
             raise ValueError("Text file knowledge source requires 'file_paths' or 'file_path'")
-        normalized = [self._normalize_to_knowledge_rel(p) for p in paths]
-        # Existence check on first element (best-effort)
-        first_abs = (self.root / normalized[0]).resolve() if not Path(normalized[0]).is_absolute() else Path(normalized[0])
-        if not first_abs.exists():
-            raise FileNotFoundError(f"Text file not found: {first_abs}")
+        normalized = self._knowledge_paths(paths, "Text file")
         return self._prefer_file_paths(
-            TextFileKnowledgeSource,
+            _source_cls("TextFileKnowledgeSource"),
             "file_path",
             normalized,
             encoding=config.encoding or "utf-8",
-            metadata={"name": source_name, "type": "text_file"},
+            metadata=dict(_TYPE_META["text_file"], name=source_name),
         )
     
     def _create_pdf_source(self, source_name: str, config: KnowledgeSourceConfig) -> PDFKnowledgeSource:
@@ -182,17 +279,14 @@ class KnowledgeLoader:
         paths = config.file_paths or ([config.file_path] if config.file_path else None)
         if not paths:
             raise ValueError("PDF knowledge source requires 'file_paths' or 'file_path'")
-        normalized = [self._normalize_to_knowledge_rel(p) for p in paths]
-        first_abs = (self.root / normalized[0]).resolve() if not Path(normalized[0]).is_absolute() else Path(normalized[0])
-        if not first_abs.exists():
-            raise FileNotFoundError(f"PDF file not found: {first_abs}")
+        normalized = self._knowledge_paths(paths, "PDF file")
         return self._prefer_file_paths(
-            PDFKnowledgeSource,
+            _source_cls("PDFKnowledgeSource"),
             "file_path",
             normalized,
             chunk_size=config.chunk_size or 1000,
             chunk_overlap=config.chunk_overlap or 200,
-            metadata={"name": source_name, "type": "pdf"},
+            metadata=dict(_TYPE_META["pdf"], name=source_name),
         )
     
     def _create_csv_source(self, source_name: str, config: KnowledgeSourceConfig) -> CSVKnowledgeSource:
@@ -200,17 +294,14 @@ class KnowledgeLoader:
         paths = config.file_paths or ([config.file_path] if config.file_path else None)
         if not paths:
             raise ValueError("CSV knowledge source requires 'file_paths' or 'file_path'")
-        normalized = [self._normalize_to_knowledge_rel(p) for p in paths]
-        first_abs = (self.root / normalized[0]).resolve() if not Path(normalized[0]).is_absolute() else Path(normalized[0])
-        if not first_abs.exists():
-            raise FileNotFoundError(f"CSV file not found: {first_abs}")
+        normalized = self._knowledge_paths(paths, "CSV file")
         return self._prefer_file_paths(
-            CSVKnowledgeSource,
+            _source_cls("CSVKnowledgeSource"),
             "file_path",
             normalized,
             source_column=config.source_column,
             metadata_columns=config.metadata_columns or [],
-            metadata={"name": source_name, "type": "csv"},
+            metadata=dict(_TYPE_META["csv"], name=source_name),
         )
     
     def _create_excel_source(self, source_name: str, config: KnowledgeSourceConfig) -> ExcelKnowledgeSource:
@@ -218,18 +309,15 @@ class KnowledgeLoader:
         paths = config.file_paths or ([config.file_path] if config.file_path else None)
         if not paths:
             raise ValueError("Excel knowledge source requires 'file_paths' or 'file_path'")
-        normalized = [self._normalize_to_knowledge_rel(p) for p in paths]
-        first_abs = (self.root / normalized[0]).resolve() if not Path(normalized[0]).is_absolute() else Path(normalized[0])
-        if not first_abs.exists():
-            raise FileNotFoundError(f"Excel file not found: {first_abs}")
+        normalized = self._knowledge_paths(paths, "Excel file")
         return self._prefer_file_paths(
-            ExcelKnowledgeSource,
+            _source_cls("ExcelKnowledgeSource"),
             "file_path",
             normalized,
             source_column=config.source_column,
             metadata_columns=config.metadata_columns or [],
             sheet_name=config.sheet_name,
-            metadata={"name": source_name, "type": "excel"},
+            metadata=dict(_TYPE_META["excel"], name=source_name),
         )
     
     def _create_json_source(self, source_name: str, config: KnowledgeSourceConfig) -> JSONKnowledgeSource:
@@ -237,15 +325,13 @@ class KnowledgeLoader:
         paths = config.file_paths or ([config.file_path] if config.file_path else None)
         if not paths:
             raise ValueError("JSON knowledge source requires 'file_paths' or 'file_path'")
-        normalized = [self._normalize_to_knowledge_rel(p) for p in paths]
-        first_abs = (self.root / normalized[0]).resolve() if not Path(normalized[0]).is_absolute() else Path(normalized[0])
-        if not first_abs.exists():
-            raise FileNotFoundError(f"JSON file not found: {first_abs}")
+        normalized = self._knowledge_paths(paths, "JSON file")
         # JSON source historically takes single file; try new then fallback
+        json_cls = _source_cls("JSONKnowledgeSource")
         try:
-            return JSONKnowledgeSource(file_paths=normalized, content_key=config.content_key, metadata_keys=config.metadata_keys or [], metadata={"name": source_name, "type": "json"})
+            return json_cls(file_paths=normalized, content_key=config.content_key, metadata_keys=config.metadata_keys or [], metadata=dict(_TYPE_META["json"], name=source_name))
         except TypeError:
-            return JSONKnowledgeSource(file_path=normalized[0], content_key=config.content_key, metadata_keys=config.metadata_keys or [], metadata={"name": source_name, "type": "json"})
+            return json_cls(file_path=normalized[0], content_key=config.content_key, metadata_keys=config.metadata_keys or [], metadata=dict(_TYPE_META["json"], name=source_name))
     
     def _create_web_content_source(self, source_name: str, config: KnowledgeSourceConfig) -> Optional[BaseKnowledgeSource]:
         """Create a web content knowledge source."""
@@ -259,7 +345,7 @@ class KnowledgeLoader:
                 file_paths=config.urls,
                 selector=config.selector,
                 max_depth=config.max_depth or 1,
-                metadata={"name": source_name, "type": "web_content"}
+                metadata=dict(_TYPE_META["web_content"], name=source_name)
             )
         except ImportError:
             console.print(
@@ -268,6 +354,17 @@ class KnowledgeLoader:
             )
             return None
 
+    # Source type -> factory; extend with KnowledgeLoader.register_type()
+    _DISPATCH: Dict[str, Callable[..., Optional[BaseKnowledgeSource]]] = {
+        "string": _create_string_source,
+        "text_file": _create_text_file_source,
+        "pdf": _create_pdf_source,
+        "csv": _create_csv_source,
+        "excel": _create_excel_source,
+        "json": _create_json_source,
+        "web_content": _create_web_content_source,
+    }
+
 
 def load_knowledge_config(root: Path, selected_sources: Optional[List[str]] = None) -> List[BaseKnowledgeSource]:
     """Load knowledge sources from configuration.
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import atexit
 import os
-from typing import Any, Dict, Iterable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from crewai_tools import MCPServerAdapter
 
@@ -11,6 +12,20 @@ try:  # Optional dependency, only needed for stdio transport
 except Exception:  # pragma: no cover - optional
     StdioServerParameters = None  # type: ignore
 
+# Every adapter opened by connect_mcp_servers, closed together at interpreter exit
+_ALL_ADAPTERS: List[MCPServerAdapter] = []
+
+
+@atexit.register
+def _close_all() -> None:
+    """Close open MCP adapters in reverse order of opening."""
+    for adapter in reversed(_ALL_ADAPTERS):
+        try:
+            adapter.__exit__(None, None, None)
+        except Exception:
+            pass
+    _ALL_ADAPTERS.clear()
+
 
 def _build_server_params(spec: "MCPServerSpec") -> Any:
     """Translate an MCPServerSpec into parameters accepted by MCPServerAdapter.
@@ -24,7 +39,8 @@ def _build_server_params(spec: "MCPServerSpec") -> Any:
             raise ImportError(
                 "mcp package is required for stdio transport. Install with: pip install mcp"
             )
-        env = {**os.environ, **(spec.env or {})}
+        env = os.environ.copy()
+        env.update(spec.env or {})
         return StdioServerParameters(
             command=spec.command,
             args=list(spec.args or []),
@@ -45,6 +61,16 @@ def _build_server_params(spec: "MCPServerSpec") -> Any:
     )
 
 
+def _connect_one(spec: "MCPServerSpec", server_params: Any) -> Tuple[Any, Any, Optional[Exception]]:
+    """Open one MCP server connection, returning (adapter, tools, error)."""
+    try:
+        adapter = MCPServerAdapter(server_params, connect_timeout=int(spec.connect_timeout or 60))
+        # Keep the connection open by manually entering context
+        return adapter, adapter.__enter__(), None
+    except Exception as e:  # noqa: BLE001
+        return None, None, e
+
+
 def connect_mcp_servers(
     servers: Iterable["MCPServerSpec"],
 ) -> Tuple[Dict[str, Any], List[MCPServerAdapter]]:
@@ -56,47 +82,48 @@ def connect_mcp_servers(
     tool_map: Dict[str, Any] = {}
     adapters: List[MCPServerAdapter] = []
 
+    pending: List[Tuple["MCPServerSpec", Any]] = []
     for spec in servers:
         if not getattr(spec, "enabled", True):
             continue
         try:
-            server_params = _build_server_params(spec)
+            pending.append((spec, _build_server_params(spec)))
         except Exception as e:  # noqa: BLE001
             # Skip this server but keep going
             print(f"[MCP] Skipping server '{spec.name}': {e}")
-            continue
 
+    if not pending:
+        return tool_map, adapters
+
+    # Handshakes block on process spawn/network, so connect to all servers at once;
+    # results are then handled in config order.
+    if len(pending) == 1:
+        outcomes = [_connect_one(*pending[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+            outcomes = list(executor.map(lambda item: _connect_one(*item), pending))
+
+    for (spec, _), (adapter, mcp_tools, error) in zip(pending, outcomes):
+        if error is not None:
+            print(f"[MCP] Failed to load tools from '{spec.name}': {error}")
+            continue
         try:
-            adapter = MCPServerAdapter(server_params, connect_timeout=int(spec.connect_timeout or 60))
-            # Keep the connection open by manually entering context
-            mcp_tools = adapter.__enter__()
             adapters.append(adapter)
-
             # Ensure cleanup on exit
-            def _make_closer(ad: MCPServerAdapter) -> None:
-                def _close() -> None:
-                    try:
-                        ad.__exit__(None, None, None)
-                    except Exception:
-                        pass
-                atexit.register(_close)
-            _make_closer(adapter)
+            _ALL_ADAPTERS.append(adapter)
 
             # Register tools with prefix and filters
             prefix = spec.name_prefix or f"{spec.name}."
-            include = set(spec.include_tools or [])
-            exclude = set(spec.exclude_tools or [])
-
-            for t in mcp_tools:
-                tname = getattr(t, "name", None) or getattr(t, "tool_name", None)
-                if not isinstance(tname, str):
-                    continue
-                if include and tname not in include:
-                    continue
-                if tname in exclude:
-                    continue
-                fq_name = f"{prefix}{tname}"
-                tool_map[fq_name] = t
+            include = frozenset(spec.include_tools or ())
+            exclude = frozenset(spec.exclude_tools or ())
+
+            tool_map.update(
+                (f"{prefix}{tname}", t)
+                for t in mcp_tools
+                if isinstance(tname := getattr(t, "name", None) or getattr(t, "tool_name", None), str)
+                and (not include or tname in include)
+                and tname not in exclude
+            )
         except Exception as e:  # noqa: BLE001
             print(f"[MCP] Failed to load tools from '{spec.name}': {e}")
             continue
@@ -16,8 +16,7 @@ from filelock import FileLock
 from pydantic import BaseModel, Field
 from rich.console import Console
 
-from .config_loader import get_project_root, load_tasks_config, load_crew_config
-from .crew import ConfigDrivenCrew
+from .config_loader import get_project_root, task_output_dirs
 
 console = Console()
 
@@ -112,12 +111,8 @@ class ScheduleStore:
 
 def _precreate_task_output_dirs(root: Path) -> None:
     try:
-        tasks_cfg = load_tasks_config(root)
-        for _, t_cfg in tasks_cfg.items():
-            out = t_cfg.get("output_file")
-            if out:
-                p = (root / out).resolve()
-                p.parent.mkdir(parents=True, exist_ok=True)
+        for out_dir in task_output_dirs(root):
+            out_dir.mkdir(parents=True, exist_ok=True)
     except Exception as e:  # noqa: BLE001
         console.print(f"[yellow]Warning: unable to pre-create output directories: {e}[/yellow]")
 
@@ -126,7 +121,8 @@ def _run_crew_job(crew_name: Optional[str], inputs: Dict[str, Any]) -> Tuple[boo
     root = get_project_root()
     _precreate_task_output_dirs(root)
     try:
-        crew_cfg = load_crew_config(root, crew_name)
+        from .crew import ConfigDrivenCrew  # deferred: pulls in crewai
+
         instance = ConfigDrivenCrew(crew_name=crew_name)
         # For scheduled jobs, run synchronously to simplify lifecycle
         result = instance.crew().kickoff(inputs=inputs or {"topic": "Hello World"})
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import shlex
+import shutil
 import subprocess
 from datetime import datetime
 import sys
@@ -1195,14 +1196,7 @@ def ui_run_tab():
 
     warn = mcp_stdio_required_warning(PROJECT_ROOT)
     need_mcp = bool(warn)
-    mcp_available = False
-    try:
-        import importlib
-
-        importlib.import_module("mcp")
-        mcp_available = True
-    except Exception:  # noqa: BLE001
-        mcp_available = False
+    mcp_available = cfg.mcp_available()
     if need_mcp and not mcp_available:
         st.warning(warn + "\nCurrently, 'mcp' does not appear to be installed. Install it with: pip install mcp")
 
@@ -1233,19 +1227,17 @@ def ui_run_tab():
                 cwd=str(PROJECT_ROOT),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                bufsize=1,
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="replace",
                 env=env,
             ) as proc:
-                from .utils import strip_ansi  # local import
+                from .utils import strip_ansi_bytes  # local import
                 logs: List[str] = []
-                for line in proc.stdout:  # type: ignore[union-attr]
-                    clean = strip_ansi(line.rstrip("\n"))
-                    logs.append(clean)
-                    if len(logs) % 5 == 0:
-                        render_scrollable_logs(log_area, "\n".join(logs), height=420)
+                for raw in proc.stdout:  # type: ignore[union-attr]
+                    # Strip colors on raw bytes, then decode; splitlines keeps universal-newline behavior
+                    text = strip_ansi_bytes(raw).decode("utf-8", errors="replace")
+                    for clean in text.splitlines():
+                        logs.append(clean)
+                        if len(logs) % 5 == 0:
+                            render_scrollable_logs(log_area, "\n".join(logs), height=420)
                 rc = proc.wait()
                 final_text = "\n".join(logs)
                 render_scrollable_logs(log_area, final_text, height=420)
@@ -1295,7 +1287,7 @@ def ui_knowledge_tab():
                     if target_path.exists():
                         ts = datetime.now().strftime("%Y%m%d-%H%M%S")
                         backup = BACKUP_DIR / f"{target_path.name}.{ts}.bak"
-                        backup.write_bytes(target_path.read_bytes())
+                        shutil.copyfile(target_path, backup)
                     target_path.write_bytes(data)
                     st.success(f"Saved {target_name}")
                 except Exception as e:  # noqa: BLE001
@@ -1332,7 +1324,7 @@ def ui_knowledge_tab():
             try:
                 ts = datetime.now().strftime("%Y%m%d-%H%M%S")
                 backup = BACKUP_DIR / f"{path.name}.{ts}.deleted.bak"
-                backup.write_bytes(path.read_bytes())
+                shutil.copyfile(path, backup)
                 path.unlink(missing_ok=False)
                 st.success("File deleted (backup saved).")
                 st.rerun()
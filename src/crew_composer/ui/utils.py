@@ -3,8 +3,9 @@ from __future__ import annotations
 import html
 import os
 import re
+import shutil
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -29,16 +30,51 @@ BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 RUN_LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _dir_signature(directory: Path) -> int:
+    """Return the directory's own mtime; it changes whenever an entry is added, removed or renamed."""
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _files_signature(directory: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Return (name, mtime_ns, size) for files in a directory; changes whenever a file does."""
+    sig = []
+    try:
+        with os.scandir(directory) as it:
+            for e in it:
+                if e.is_file():
+                    st = e.stat()
+                    sig.append((e.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return ()
+    return tuple(sorted(sig))
+
+
+_KNOWN_YAML_FILES = (
+    "agents.yaml",
+    "agents.knowledge.yaml",
+    "crews.yaml",
+    "tasks.yaml",
+    "tools.yaml",
+    "mcp_tools.yaml",
+)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_yaml_files_cached(config_dir: Path, sig: int) -> List[Path]:
+    # One directory listing instead of an exists() call per known file
+    try:
+        with os.scandir(config_dir) as it:
+            present = {e.name for e in it if e.is_file()}
+    except OSError:
+        return []
+    return [config_dir / name for name in _KNOWN_YAML_FILES if name in present]
+
+
 def list_yaml_files(config_dir: Path) -> List[Path]:
-    known = [
-        config_dir / "agents.yaml",
-        config_dir / "agents.knowledge.yaml",
-        config_dir / "crews.yaml",
-        config_dir / "tasks.yaml",
-        config_dir / "tools.yaml",
-        config_dir / "mcp_tools.yaml",
-    ]
-    return [p for p in known if p.exists()]
+    return _list_yaml_files_cached(config_dir, _dir_signature(config_dir))
 
 
 def read_text(path: Path) -> str:
@@ -49,22 +85,41 @@ def read_text(path: Path) -> str:
 
 
 def safe_write_text(path: Path, content: str) -> Tuple[bool, str]:
+    tmp = path.with_suffix(path.suffix + ".tmp")
     try:
-        if path.exists():
-            ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+        existed = path.exists()
+        if existed:
+            ts = time.strftime("%Y%m%d-%H%M%S")
             backup = BACKUP_DIR / f"{path.name}.{ts}.bak"
-            backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+            shutil.copyfile(path, backup)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        # Write to a sibling temp file and swap it in so readers never see a partial file
+        tmp.write_text(content, encoding="utf-8")
+        if existed:
+            # Keep the original file's permissions
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
         return True, "Saved successfully. Backup created if file existed."
     except Exception as e:  # noqa: BLE001
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
         return False, f"Error saving file: {e}"
 
 
-def list_knowledge_files() -> List[Path]:
-    if not KNOWLEDGE_DIR.exists():
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_knowledge_files_cached(sig: int) -> List[Path]:
+    # DirEntry.is_file() uses d_type from the directory listing, avoiding a stat per entry
+    try:
+        with os.scandir(KNOWLEDGE_DIR) as it:
+            return sorted(Path(e.path) for e in it if e.is_file())
+    except FileNotFoundError:
         return []
-    return sorted([p for p in KNOWLEDGE_DIR.iterdir() if p.is_file()])
+
+
+def list_knowledge_files() -> List[Path]:
+    return _list_knowledge_files_cached(_dir_signature(KNOWLEDGE_DIR))
 
 
 def yaml_is_valid(content: str) -> Tuple[bool, str]:
@@ -76,6 +131,7 @@ def yaml_is_valid(content: str) -> Tuple[bool, str]:
 
 
 ANSI_PATTERN = re.compile(r"\x1B\[[0-9;]*[mK]")
+ANSI_BYTES_PATTERN = re.compile(rb"\x1B\[[0-9;]*[mK]")
 
 
 def strip_ansi(s: str) -> str:
@@ -85,27 +141,47 @@ def strip_ansi(s: str) -> str:
         return s
 
 
+def strip_ansi_bytes(b: bytes) -> bytes:
+    """Strip ANSI color codes from raw process output before it is decoded."""
+    try:
+        return ANSI_BYTES_PATTERN.sub(b"", b)
+    except Exception:  # noqa: BLE001
+        return b
+
+
 def mcp_stdio_required_warning(root: Path) -> str:
     """Return a warning string if any configured MCP server uses stdio transport."""
     try:
-        crew_cfg = cfg.load_crew_config(root)
-        servers = cfg.load_mcp_servers_config(root, crew_cfg.tools_files)
-        for spec in servers:
-            transport = (getattr(spec, "transport", "") or "").lower()
-            if transport == "stdio" or (not transport and getattr(spec, "command", None)):
-                return (
-                    "Detected MCP server(s) using stdio. Ensure the 'mcp' package is installed in your venv "
-                    "before running crews or disable those servers in config/mcp_tools.yaml."
-                )
+        if cfg.mcp_stdio_required(root):
+            return (
+                "Detected MCP server(s) using stdio. Ensure the 'mcp' package is installed in your venv "
+                "before running crews or disable those servers in config/mcp_tools.yaml."
+            )
         return ""
     except Exception:  # noqa: BLE001
         return ""
 
 
+# Upper bound on log characters embedded per render
+LOG_TAIL_CHARS = 256 * 1024
+
+
 def render_scrollable_logs(placeholder: st.delta_generator.DeltaGenerator, text: str, height: int = 420) -> None:
-    """Render text with a fixed height and scrollbars using HTML in a placeholder."""
+    """Render text with a fixed height and scrollbars using HTML in a placeholder.
+
+    Only the last LOG_TAIL_CHARS characters are embedded so render cost stays bounded
+    on long runs; the full log can still be saved from the Run tab.
+    """
     try:
-        safe = html.escape(text or "")
+        text = text or ""
+        if len(text) > LOG_TAIL_CHARS:
+            # Escape only the displayed tail, starting at a line boundary
+            tail = text[-LOG_TAIL_CHARS:]
+            nl = tail.find("\n")
+            tail = tail[nl + 1:] if nl != -1 else tail
+            safe = "[... earlier output truncated; use 'Save logs to file' for the full log ...]\n" + html.escape(tail)
+        else:
+            safe = html.escape(text)
         # We preserve the user's intent: if they were at the bottom before the update,
         # we auto-scroll to bottom after rendering. Otherwise, we keep their scroll position.
         # We approximate this across rerenders using sessionStorage.
@@ -145,21 +221,19 @@ def render_scrollable_logs(placeholder: st.delta_generator.DeltaGenerator, text:
         placeholder.code(text or "", language="bash")
 
 
-def get_available_tool_names() -> List[str]:
-    names: List[str] = []
+@st.cache_data(ttl=60, show_spinner=False)
+def _available_tool_names_cached(sig: Tuple) -> List[str]:
     try:
         try:
             crew_cfg = cfg.load_crew_config(PROJECT_ROOT)
             tc = cfg.load_tools_config(PROJECT_ROOT, crew_cfg.tools_files)
         except Exception:  # noqa: BLE001
             tc = cfg.load_tools_config(PROJECT_ROOT)
-        for specs in (tc.tools or {}).values():
-            for spec in specs:
-                try:
-                    names.append(str(spec.name))
-                except Exception:  # noqa: BLE001
-                    continue
-        names = sorted(list({n for n in names if n}))
+        return sorted({spec.name for specs in (tc.tools or {}).values() for spec in specs if spec.name})
     except Exception:  # noqa: BLE001
-        names = []
-    return names
+        return []
+
+
+def get_available_tool_names() -> List[str]:
+    # Keyed on the config/ files so any YAML edit invalidates the cached names
+    return _available_tool_names_cached(_files_signature(CONFIG_DIR))
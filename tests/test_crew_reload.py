@@ -0,0 +1,42 @@
+"""ConfigDrivenCrew.kickoff_async must rebuild from edited YAML, not CrewBase's startup copy."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+
+import pytest
+import yaml
+
+pytest.importorskip("crewai")
+
+from crewai import Crew  # noqa: E402
+
+from crew_composer import crew as crew_module  # noqa: E402
+from crew_composer.config_loader import get_project_root  # noqa: E402
+
+
+def test_kickoff_async_uses_edited_agent_role(tmp_path, monkeypatch):
+    shutil.copytree(get_project_root() / "config", tmp_path / "config")
+    monkeypatch.setattr(crew_module, "get_project_root", lambda: tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", os.environ.get("OPENAI_API_KEY", "test-key"))
+
+    # Return the Crew that would run instead of calling an LLM
+    async def _fake_kickoff_async(self, inputs=None):
+        return self
+
+    monkeypatch.setattr(Crew, "kickoff_async", _fake_kickoff_async)
+
+    instance = crew_module.ConfigDrivenCrew()
+    first = asyncio.run(instance.kickoff_async({"topic": "reload"}))
+    assert "Edited Researcher" not in {a.role for a in first.agents}
+
+    agents_path = tmp_path / "config" / "agents.yaml"
+    agents = yaml.safe_load(agents_path.read_text(encoding="utf-8"))
+    agents["researcher"]["role"] = "Edited Researcher"
+    agents_path.write_text(yaml.safe_dump(agents, sort_keys=False), encoding="utf-8")
+
+    second = asyncio.run(instance.kickoff_async({"topic": "reload"}))
+    assert second is not first
+    assert "Edited Researcher" in {a.role for a in second.agents}